@@ -32,17 +32,33 @@ from .schemas import (
     EscolherBilhetesIniciaisRequest,
     EscolhaBilhetesIniciaisResponse
 )
+import asyncio
 import logging
 import pickle
 import uuid
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
 from random import sample
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Ciclo de vida da aplicação: garante que uma gravação pendente não se perca ao desligar."""
+    yield
+    if persistencia_agendada is not None:
+        persistencia_agendada.cancel()
+        gravar_jogos_em_disco()
+
 
 app = FastAPI(
     title="Ticket to Ride API",
     description="API RESTful para o jogo Ticket to Ride",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -66,6 +82,13 @@ active_games: Dict[str, Jogo] = {}
 CACHE_FILE = Path(__file__).resolve().parent / ".games_cache.pkl"
 LOGGER = logging.getLogger("ticket_to_ride.api")
 LONGEST_PATH_CALCULATOR = LongestPathCalculator()
+CHAVE_PONTUACAO_TOTAL = itemgetter("pontuacao_total")
+# Janela em que gravações seguidas do cache são agrupadas em uma só
+PERSISTENCIA_ATRASO_SEGUNDOS = 0.2
+persistencia_agendada: Optional[asyncio.TimerHandle] = None
+# Payloads de carta já montados, por (cor, ehLocomotiva): o baralho só
+# tem 9 combinações possíveis, então o cache é pequeno e limitado.
+CARTAS_FORMATADAS: Dict[Tuple[Cor, bool], Dict[str, object]] = {}
 
 
 def load_active_games_from_disk() -> None:
@@ -85,16 +108,37 @@ def load_active_games_from_disk() -> None:
         LOGGER.warning("Failed to load cached games: %s", exc)
 
 
-def persist_active_games() -> None:
-    """Persiste o estado atual dos jogos para sobreviver a reloads."""
+def gravar_jogos_em_disco() -> None:
+    """Grava imediatamente o estado atual dos jogos no cache em disco."""
+    global persistencia_agendada
+    persistencia_agendada = None
     try:
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         with CACHE_FILE.open("wb") as cache:
-            pickle.dump(active_games, cache)
+            pickle.dump(active_games, cache, protocol=pickle.HIGHEST_PROTOCOL)
     except Exception as exc:  # pragma: no cover - logging auxiliar
         LOGGER.warning("Failed to persist games cache: %s", exc)
 
 
+def persist_active_games() -> None:
+    """Persiste o estado atual dos jogos para sobreviver a reloads.
+
+    Dentro do event loop a gravação é adiada por PERSISTENCIA_ATRASO_SEGUNDOS:
+    ações seguidas (ex.: duas compras de carta no mesmo turno) geram uma
+    única escrita. O flush roda no próprio loop, entre requisições, então
+    nunca serializa um jogo no meio de uma mutação.
+    """
+    global persistencia_agendada
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        gravar_jogos_em_disco()
+        return
+
+    if persistencia_agendada is None:
+        persistencia_agendada = loop.call_later(PERSISTENCIA_ATRASO_SEGUNDOS, gravar_jogos_em_disco)
+
+
 load_active_games_from_disk()
 
 
@@ -103,9 +147,10 @@ def calcular_maior_caminho_status(jogo: Jogo) -> Optional[MaiorCaminhoStatusResp
     if not jogo or not jogo.tabuleiro:
         return None
 
+    rotas_por_jogador = jogo.rotasPorJogador()
     resultados: List[Dict[str, object]] = []
     for jogador in jogo.gerenciadorDeTurnos.jogadores:
-        rotas_jogador = [r for r in jogo.tabuleiro.rotas if r.proprietario == jogador]
+        rotas_jogador = rotas_por_jogador[jogador.id]
         comprimento = 0
         if rotas_jogador:
             comprimento = LONGEST_PATH_CALCULATOR.calcular_maior_caminho(rotas_jogador)
@@ -113,7 +158,7 @@ def calcular_maior_caminho_status(jogo: Jogo) -> Optional[MaiorCaminhoStatusResp
         resultados.append({
             "jogador_id": jogador.id,
             "jogador_nome": jogador.nome,
-            "jogador_cor": jogador.cor.value if hasattr(jogador.cor, "value") else jogador.cor,
+            "jogador_cor": getattr(jogador.cor, "value", jogador.cor),
             "comprimento": comprimento
         })
 
@@ -137,6 +182,38 @@ def calcular_maior_caminho_status(jogo: Jogo) -> Optional[MaiorCaminhoStatusResp
     )
 
 
+def formatar_rota(rota) -> Dict[str, object]:
+    """Monta o payload de uma rota, já com os dados do proprietário."""
+    proprietario = rota.proprietario
+    if proprietario is not None:
+        proprietario_id, proprietario_nome, proprietario_cor = (
+            proprietario.id, proprietario.nome, proprietario.cor.value
+        )
+    else:
+        proprietario_id = proprietario_nome = proprietario_cor = None
+
+    return {
+        "id": rota.id,
+        "cidadeA": rota.cidadeA.nome,
+        "cidadeB": rota.cidadeB.nome,
+        "cor": rota.cor.value,
+        "comprimento": rota.comprimento,
+        "proprietario_id": proprietario_id,
+        "proprietario_nome": proprietario_nome,
+        "proprietario_cor": proprietario_cor,
+        "conquistada": rota.ehConcluida
+    }
+
+
+def formatar_carta(carta) -> Dict[str, object]:
+    """Retorna o payload de uma carta de vagão (compartilhado, não alterar)."""
+    chave = (carta.cor, carta.ehLocomotiva)
+    formatada = CARTAS_FORMATADAS.get(chave)
+    if formatada is None:
+        formatada = CARTAS_FORMATADAS[chave] = {"cor": carta.cor.value, "eh_locomotiva": carta.ehLocomotiva}
+    return formatada
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -215,18 +292,19 @@ async def create_game(request: CreateGameRequest):
     persist_active_games()
     
     # Retorna resposta com jogadores incluídos
+    jogadores = jogo.gerenciadorDeTurnos.jogadores
     jogadores_response = [
         {
             "id": j.id,
             "nome": j.nome,
             "cor": j.cor.value
         }
-        for j in jogo.gerenciadorDeTurnos.jogadores
+        for j in jogadores
     ]
     
     return {
         "game_id": game_id,
-        "numero_jogadores": len(jogo.gerenciadorDeTurnos.jogadores),
+        "numero_jogadores": len(jogadores),
         "iniciado": jogo.iniciado,
         "finalizado": jogo.finalizado,
         "jogadores": jogadores_response
@@ -245,13 +323,14 @@ async def get_game_state(game_id: str):
         raise HTTPException(status_code=404, detail="Game not found")
     
     # Converte jogadores para response
+    placar = jogo.placar
     jogadores = [
         JogadorResponse(
             id=j.id,
             nome=j.nome,
-            cor=j.cor,
+            cor=j.cor.value,
             trens_disponiveis=len(j.vagoes),  # Número de vagões disponíveis
-            pontos=jogo.placar.obter_pontuacao(j.id) if jogo.placar else 0  # snake_case!
+            pontos=placar.obter_pontuacao(j.id) if placar else 0  # snake_case!
         )
         for j in jogo.gerenciadorDeTurnos.jogadores
     ]
@@ -294,10 +373,7 @@ async def get_player_cards(game_id: str, player_id: str):
     
     return {
         "player_id": player_id,
-        "cards": [
-            {"cor": carta.cor.value, "eh_locomotiva": carta.ehLocomotiva}
-            for carta in jogador.cartasVagao
-        ]  # Backend envia lowercase
+        "cards": [formatar_carta(carta) for carta in jogador.cartasVagao]  # Backend envia lowercase
     }
 
 
@@ -316,31 +392,31 @@ async def get_player_tickets(game_id: str, player_id: str):
     if not jogador:
         raise HTTPException(status_code=404, detail="Player not found")
     
-    # Verifica quais bilhetes foram completados usando o pathfinder
-    bilhetes_com_status = []
-    
     # Obter rotas conquistadas pelo jogador
-    rotas_jogador = [r for r in jogo.tabuleiro.rotas if r.proprietario == jogador]
-    
-    for bilhete in jogador.bilhetes:
-        completo = False
-        if jogo.pathfinder:
-            completo = jogo.pathfinder.verificar_bilhete_completo(
-                bilhete=bilhete,
-                rotas_conquistadas=rotas_jogador
-            )
-        
-        bilhetes_com_status.append({
-            "id": bilhete.id,
-            "cidadeOrigem": bilhete.cidadeOrigem.nome,
-            "cidadeDestino": bilhete.cidadeDestino.nome,
-            "pontos": bilhete.pontos,
-            "completo": completo
-        })
+    rotas_jogador = jogo.rotasPorJogador().get(jogador.id, [])
+    
+    # Verifica quais bilhetes foram completados usando o pathfinder
+    # (um único grafo de rotas é montado para todos os bilhetes)
+    if jogo.pathfinder:
+        status_bilhetes = jogo.pathfinder.verificar_bilhetes(
+            bilhetes=jogador.bilhetes,
+            rotas_conquistadas=rotas_jogador
+        )
+    else:
+        status_bilhetes = repeat(False)
     
     return {
         "player_id": player_id,
-        "tickets": bilhetes_com_status
+        "tickets": [
+            {
+                "id": bilhete.id,
+                "cidadeOrigem": bilhete.cidadeOrigem.nome,
+                "cidadeDestino": bilhete.cidadeDestino.nome,
+                "pontos": bilhete.pontos,
+                "completo": completo
+            }
+            for bilhete, completo in zip(jogador.bilhetes, status_bilhetes)
+        ]
     }
 
 
@@ -355,24 +431,9 @@ async def get_game_routes(game_id: str):
     if not jogo:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    routes_data = []
-    for rota in jogo.tabuleiro.rotas:
-        route_info = {
-            "id": rota.id,
-            "cidadeA": rota.cidadeA.nome,
-            "cidadeB": rota.cidadeB.nome,
-            "cor": rota.cor.value,
-            "comprimento": rota.comprimento,
-            "proprietario_id": rota.proprietario.id if rota.proprietario else None,
-            "proprietario_nome": rota.proprietario.nome if rota.proprietario else None,
-            "proprietario_cor": rota.proprietario.cor.value if rota.proprietario else None,
-            "conquistada": rota.ehConcluida
-        }
-        routes_data.append(route_info)
-    
     return {
         "game_id": game_id,
-        "routes": routes_data
+        "routes": [formatar_rota(rota) for rota in jogo.tabuleiro.rotas]
     }
 
 
@@ -681,35 +742,26 @@ async def conquer_route(game_id: str, player_id: str, request: ConquistarRotaReq
         raise HTTPException(status_code=404, detail="Player not found")
     
     # Buscar rota pelo ID
-    rota = next((r for r in jogo.tabuleiro.rotas if r.id == request.rota_id), None)
+    rota = jogo.tabuleiro.obterRotaPorId(request.rota_id)
     if not rota:
         raise HTTPException(status_code=404, detail="Route not found")
     
-    # Buscar cartas usadas da mão do jogador
-    cartas_em_mao = list(jogador.mao.cartasVagao)
+    # Buscar cartas usadas da mão do jogador (agrupadas por cor efetiva)
+    cartas_por_cor: Dict[str, deque] = defaultdict(deque)
+    for carta in jogador.mao.cartasVagao:
+        chave = "locomotiva" if carta.ehLocomotiva else carta.cor.value
+        cartas_por_cor[chave].append(carta)
+
     cartas_usadas = []
     for carta_cor in request.cartas_usadas:
-        cor_normalizada = carta_cor.lower()
-
-        indice_encontrado = next(
-            (
-                idx
-                for idx, carta in enumerate(cartas_em_mao)
-                if (
-                    (carta.ehLocomotiva and cor_normalizada == "locomotiva")
-                    or carta.cor.value == cor_normalizada
-                )
-            ),
-            None,
-        )
-
-        if indice_encontrado is None:
+        fila = cartas_por_cor.get(carta_cor.lower())
+        if not fila:
             raise HTTPException(
                 status_code=400,
                 detail=f"Card {carta_cor} not found in player's hand",
             )
 
-        cartas_usadas.append(cartas_em_mao.pop(indice_encontrado))
+        cartas_usadas.append(fila.popleft())
     
     # Importar componentes necessários
     from .models.descarte_manager import DescarteManager
@@ -806,7 +858,8 @@ async def buy_tickets(game_id: str, player_id: str, request: ComprarBilhetesRequ
     total_disponivel = len(bilhetes_reservados)
     indices_unicos = sorted(set(indices_escolhidos))
 
-    if any(indice < 0 or indice >= total_disponivel for indice in indices_unicos):
+    # A lista é ordenada e não vazia: basta checar os extremos
+    if not (0 <= indices_unicos[0] and indices_unicos[-1] < total_disponivel):
         raise HTTPException(status_code=400, detail="Invalid ticket indices")
 
     bilhetes_escolhidos = [bilhetes_reservados[indice] for indice in indices_unicos]
@@ -828,10 +881,10 @@ async def buy_tickets(game_id: str, player_id: str, request: ComprarBilhetesRequ
     quantidade_escolhidos = len(bilhetes_escolhidos)
     quantidade_recusados = len(bilhetes_recusados)
 
-    destino_texto = ", ".join(
+    destino_texto = ", ".join([
         f"{bilhete.cidadeOrigem.nome} → {bilhete.cidadeDestino.nome}"
         for bilhete in bilhetes_escolhidos
-    )
+    ])
 
     mensagem = (
         f"{jogador.nome} ficou com {quantidade_escolhidos} bilhete(s)"
@@ -943,10 +996,11 @@ async def get_pontuacao_final(game_id: str):
     
     # Calcular pontuações de todos os jogadores
     resultados = {}
+    rotas_por_jogador = jogo.rotasPorJogador()
     
     for jogador in jogo.gerenciadorDeTurnos.jogadores:
         # Obter rotas conquistadas pelo jogador
-        rotas_jogador = [r for r in jogo.tabuleiro.rotas if r.proprietario == jogador]
+        rotas_jogador = rotas_por_jogador[jogador.id]
         
         # Calcular pontuação
         resultado = calculator.calcular_pontuacao_jogador(
@@ -1000,9 +1054,10 @@ async def get_pontuacao_final(game_id: str):
     vencedor = empatados[0] if len(empatados) == 1 else empatados
     
     # Converter resultados para JSON
+    jogadores_por_id = {j.id: j for j in jogo.gerenciadorDeTurnos.jogadores}
     pontuacoes = []
     for jogador_id, resultado in resultados.items():
-        jogador = jogo.buscarJogador(jogador_id)
+        jogador = jogadores_por_id.get(jogador_id)
         
         pontuacoes.append({
             "jogador_id": jogador_id,
@@ -1036,14 +1091,14 @@ async def get_pontuacao_final(game_id: str):
         })
     
     # Ordenar por pontuação (maior primeiro)
-    pontuacoes.sort(key=lambda p: p["pontuacao_total"], reverse=True)
+    pontuacoes.sort(key=CHAVE_PONTUACAO_TOTAL, reverse=True)
     
     # Criar mensagem de vencedor
     if isinstance(vencedor, list):
-        nomes = [jogo.buscarJogador(v).nome for v in vencedor]
+        nomes = [jogadores_por_id[v].nome for v in vencedor]
         mensagem = f"Empate! Vencedores: {', '.join(nomes)}"
     else:
-        jogador_vencedor = jogo.buscarJogador(vencedor)
+        jogador_vencedor = jogadores_por_id[vencedor]
         mensagem = f"{jogador_vencedor.nome} venceu o jogo!"
     
     return {
@@ -88,6 +88,8 @@ def carregar_tabuleiro_brasil(tabuleiro: Tabuleiro) -> Dict[str, object]:
     """
 
     if tabuleiro.cidades and tabuleiro.rotas:
+        # Mapa customizado: as rotas foram inseridas direto na lista
+        tabuleiro.indexarRotas()
         return {
             "cidades": len(tabuleiro.cidades),
             "rotas": len(tabuleiro.rotas),
@@ -113,6 +115,8 @@ def carregar_tabuleiro_brasil(tabuleiro: Tabuleiro) -> Dict[str, object]:
         )
         tabuleiro.rotas.append(rota)
 
+    tabuleiro.indexarRotas()
+
     return {
         "cidades": len(tabuleiro.cidades),
         "rotas": len(tabuleiro.rotas),
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from .cidade import Cidade, CIDADES
+from .cidade import Cidade, get_cidade
 from .carta import Carta
 
-@dataclass
+@dataclass(slots=True)
 class BilheteDestino(Carta):
     cidadeOrigem: Cidade = None
     cidadeDestino: Cidade = None
@@ -14,14 +14,6 @@ class BilheteDestino(Carta):
         return f"<Bilhete ({self.pontos})>"
 
 
-# 🔽 Função auxiliar para buscar cidade por ID
-def get_cidade(id: str) -> Cidade:
-    for c in CIDADES:
-        if c.id == id:
-            return c
-    raise ValueError(f"Cidade '{id}' não encontrada em CIDADES.")
-
-
 # 🎯 30 cartas de destino — Ticket to Ride: Brasil
 BILHETES_DESTINO: list[BilheteDestino] = [
     BilheteDestino(cidadeOrigem=get_cidade("PORTO_ALEGRE"), cidadeDestino=get_cidade("BAURU"), pontos=5),
@@ -1,6 +1,6 @@
 import uuid
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class Carta:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .carta import Carta
 from .cor import Cor
 
-@dataclass
+@dataclass(slots=True)
 class CartaVagao(Carta):
     cor: Cor = Cor.VERMELHO
     ehLocomotiva: bool = False
@@ -32,10 +32,25 @@ from .carta_vagao import CartaVagao
 from .descarte_manager import DescarteManager, ConquistaRotaService
 from .rota_validation_strategy import criar_estrategia_validacao
 from .validador_rotas_duplas import ValidadorRotasDuplas
-from .placar import Placar
+from .placar import Placar, TABELA_PONTOS_ROTA
 from .gerenciador_fim_jogo import GerenciadorFimDeJogo
 
 
+# Campos fixos da resposta de erro; _erro preenche "mensagem" e acrescenta um
+# "detalhes" novo a cada chamada (nunca compartilhado entre resultados)
+RESULTADO_ERRO_BASE: Dict = {
+    "sucesso": False,
+    "mensagem": "",
+    "pontos_ganhos": 0,
+    "cartas_descartadas": 0,
+    "trens_removidos": 0,
+    "trens_restantes": 0,
+    "rota_dupla_bloqueada": False,
+    "fim_de_jogo_ativado": False,
+    "alerta_fim_jogo": None,
+}
+
+
 @dataclass
 class ConquistaRotaController:
     """
@@ -189,24 +204,17 @@ class ConquistaRotaController:
     
     def _erro(self, mensagem: str) -> Dict:
         """Retorna dicionário de erro padronizado"""
-        return {
-            "sucesso": False,
-            "mensagem": mensagem,
-            "pontos_ganhos": 0,
-            "cartas_descartadas": 0,
-            "trens_removidos": 0,
-            "trens_restantes": 0,
-            "rota_dupla_bloqueada": False,
-            "fim_de_jogo_ativado": False,
-            "alerta_fim_jogo": None,
-            "detalhes": {}
-        }
+        resultado = RESULTADO_ERRO_BASE.copy()
+        resultado["mensagem"] = mensagem
+        resultado["detalhes"] = {}
+        return resultado
     
-    def _calcular_pontos_rota(self, comprimento: int) -> int:
+    @staticmethod
+    def _calcular_pontos_rota(comprimento: int) -> int:
         """
         Calcula pontos conforme tabela de pontuação.
         
-        Tabela Ticket to Ride:
+        Tabela Ticket to Ride (TABELA_PONTOS_ROTA do Placar):
         - 1 vagão: 1 ponto
         - 2 vagões: 2 pontos
         - 3 vagões: 4 pontos
@@ -214,16 +222,7 @@ class ConquistaRotaController:
         - 5 vagões: 10 pontos
         - 6 vagões: 15 pontos
         """
-        tabela_pontos = {
-            1: 1,
-            2: 2,
-            3: 4,
-            4: 7,
-            5: 10,
-            6: 15
-        }
-        
-        return tabela_pontos.get(comprimento, 0)
+        return TABELA_PONTOS_ROTA.get(comprimento, 0)
     
     def _construir_mensagem_sucesso(
         self,
@@ -282,7 +281,7 @@ class ConquistaRotaPreview:
             - mensagem: str explicativa
         """
         comprimento = rota.comprimento
-        pontos = ConquistaRotaController._calcular_pontos_rota(None, comprimento)
+        pontos = ConquistaRotaController._calcular_pontos_rota(comprimento)
         
         # Verificar trens
         pode_por_trens = trens_disponiveis >= comprimento
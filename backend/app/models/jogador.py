@@ -1,11 +1,12 @@
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List
 from .cor import Cor
-from .mao import Mao
+from .mao import Mao, separar_cartas
 from .bilhete_destino import BilheteDestino
 
-@dataclass
+@dataclass(slots=True)
 class Jogador:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     nome: str = ""
@@ -26,15 +27,20 @@ class Jogador:
         self.mao.adicionarCarta(carta)
         self.cartasVagao.append(carta)
 
+    def comprarCartasVagao(self, cartas: List):
+        """Adiciona um lote de cartas vagão à mão (ex.: distribuição inicial)"""
+        self.mao.adicionarCartas(cartas)
+        self.cartasVagao.extend(cartas)
+
     def removerCartasVagao(self, cartas: List):
         """Remove cartas tanto da mão quanto do inventário plano."""
 
         if not self.mao.removerCartas(cartas):
             return False
 
-        for carta in cartas:
-            if carta in self.cartasVagao:
-                self.cartasVagao.remove(carta)
+        # Uma passada pelo inventário em vez de "in" + remove() por carta
+        restantes, _ = separar_cartas(self.cartasVagao, cartas)
+        self.cartasVagao[:] = restantes
 
         return True
 
@@ -72,5 +78,4 @@ class Jogador:
 
     def escolherCoresDisponiveis(self):
         """Retorna as cores disponíveis na mão do jogador"""
-        from collections import Counter
         return Counter([c.cor for c in self.mao.cartasVagao if not c.ehLocomotiva])
@@ -3,8 +3,9 @@ from typing import Dict, List, Optional, Tuple
 
 from .gerenciador_de_turnos import GerenciadorDeTurnos
 from .gerenciador_de_baralho import GerenciadorDeBaralho
-from .placar import Placar
+from .placar import Placar, TABELA_PONTOS_ROTA
 from .tabuleiro import Tabuleiro
+from .rota import Rota
 from .bilhete_destino import BilheteDestino
 from .estado_compra_cartas import EstadoCompraCartas
 from .descarte_manager import DescarteManager
@@ -39,11 +40,39 @@ class Jogo:
 
     def buscarJogador(self, jogador_id: str):
         """Retorna o jogador com o ID informado ou None."""
+        alvo = str(jogador_id)
         return next(
-            (j for j in self.gerenciadorDeTurnos.jogadores if str(j.id) == str(jogador_id)),
+            (j for j in self.gerenciadorDeTurnos.jogadores if str(j.id) == alvo),
             None,
         )
 
+    def rotasPorJogador(self) -> Dict[str, List[Rota]]:
+        """Agrupa as rotas conquistadas pelo ID do proprietário.
+
+        Percorre o tabuleiro uma única vez, para que endpoints que precisam
+        das rotas de todos os jogadores não refaçam o filtro por jogador.
+        Rotas bloqueadas (proprietário sem ID) são ignoradas.
+        """
+        rotas_por_jogador: Dict[str, List[Rota]] = {
+            j.id: [] for j in self.gerenciadorDeTurnos.jogadores
+        }
+        for rota in self.tabuleiro.rotas:
+            proprietario_id = getattr(rota.proprietario, "id", None)
+            if proprietario_id in rotas_por_jogador:
+                rotas_por_jogador[proprietario_id].append(rota)
+        return rotas_por_jogador
+
+    @staticmethod
+    def _formatarCarta(carta) -> dict:
+        """Representação de uma carta de vagão nas respostas de compra."""
+        return {"cor": carta.cor.value, "ehLocomotiva": carta.ehLocomotiva}
+
+    def _cartasAbertasFormatadas(self) -> List[dict]:
+        """Cartas abertas no formato das respostas de compra ([] sem baralho)."""
+        if not self.gerenciadorDeBaralho:
+            return []
+        return [self._formatarCarta(c) for c in self.gerenciadorDeBaralho.obterCartasAbertas()]
+
     def iniciar(self):
         """Inicializa o jogo
         
@@ -97,11 +126,10 @@ class Jogo:
         
         Regra oficial: Cada jogador começa com 4 cartas de vagão
         """
+        comprar = self.gerenciadorDeBaralho.comprarCartaVagaoViewer
         for jogador in self.gerenciadorDeTurnos.jogadores:
-            for _ in range(4):
-                carta = self.gerenciadorDeBaralho.comprarCartaVagaoViewer(visivel=False)
-                if carta:
-                    jogador.comprarCartaVagao(carta)
+            cartas = [comprar(visivel=False) for _ in range(4)]
+            jogador.comprarCartasVagao([carta for carta in cartas if carta])
         
         print(f"[OK] Distribuidas 4 cartas iniciais para {len(self.gerenciadorDeTurnos.jogadores)} jogadores")
 
@@ -220,7 +248,7 @@ class Jogo:
         
         return {
             "sucesso": True,
-            "carta": {"cor": carta.cor.value, "ehLocomotiva": carta.ehLocomotiva},
+            "carta": self._formatarCarta(carta),
             "cartasCompradas": self.estadoCompraCartas.cartasCompradas,
             "turnoCompleto": self.estadoCompraCartas.turnoCompleto,
             "mensagem": self.estadoCompraCartas.obterMensagemStatus()
@@ -276,10 +304,10 @@ class Jogo:
         
         return {
             "sucesso": True,
-            "carta": {"cor": carta.cor.value, "ehLocomotiva": carta.ehLocomotiva},
+            "carta": self._formatarCarta(carta),
             "cartasCompradas": self.estadoCompraCartas.cartasCompradas,
             "turnoCompleto": self.estadoCompraCartas.turnoCompleto,
-            "cartasAbertas": [{"cor": c.cor.value, "ehLocomotiva": c.ehLocomotiva} for c in self.gerenciadorDeBaralho.obterCartasAbertas()],
+            "cartasAbertas": self._cartasAbertasFormatadas(),
             "mensagem": self.estadoCompraCartas.obterMensagemStatus()
         }
 
@@ -294,7 +322,7 @@ class Jogo:
             "comprouLocomotivaDasAbertas": self.estadoCompraCartas.comprouLocomotivaDasAbertas,
             "turnoCompleto": self.estadoCompraCartas.turnoCompleto,
             "podeComprarFechada": self.estadoCompraCartas.podeComprarCartaFechada(),
-            "cartasAbertas": [{"cor": c.cor.value, "ehLocomotiva": c.ehLocomotiva} for c in self.gerenciadorDeBaralho.obterCartasAbertas()] if self.gerenciadorDeBaralho else [],
+            "cartasAbertas": self._cartasAbertasFormatadas(),
             "mensagem": self.estadoCompraCartas.obterMensagemStatus()
         }
 
@@ -329,8 +357,7 @@ class Jogo:
                     if rota.reivindicarRota(jogador_atual, parametros["cartas"]):
                         jogador_atual.reivindicarRota(rota)
                         # Adiciona pontos baseado no comprimento da rota
-                        pontos_rota = {1: 1, 2: 2, 3: 4, 4: 7, 5: 10, 6: 15}
-                        jogador_atual.pontuacao += pontos_rota.get(rota.comprimento, 0)
+                        jogador_atual.pontuacao += TABELA_PONTOS_ROTA.get(rota.comprimento, 0)
         
         elif acao == "comprar_bilhetes":
             bilhetes = self.gerenciadorDeBaralho.comprarBilhetes()
@@ -1,7 +1,32 @@
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
 from .carta_vagao import CartaVagao
 
+
+def chave_carta(carta: CartaVagao) -> tuple:
+    """Chave hasheável equivalente ao __eq__ gerado pelo dataclass de CartaVagao"""
+    return (carta.id, carta.cor, carta.ehLocomotiva)
+
+
+def separar_cartas(lista: List[CartaVagao], cartas: List[CartaVagao]) -> Tuple[List[CartaVagao], Counter]:
+    """Separa de lista uma ocorrência de cada carta pedida, em uma única passada
+
+    Returns:
+        (restantes, pendentes): cartas que ficam na lista e a contagem, por
+        chave_carta, das cartas pedidas que não foram encontradas
+    """
+    pendentes = Counter(map(chave_carta, cartas))
+    restantes = []
+    for c in lista:
+        chave = chave_carta(c)
+        if pendentes[chave] > 0:
+            pendentes[chave] -= 1
+        else:
+            restantes.append(c)
+    return restantes, pendentes
+
+
 @dataclass
 class Mao:
     cartasVagao: List[CartaVagao] = field(default_factory=list)
@@ -10,17 +35,25 @@ class Mao:
         """Adiciona uma carta à mão"""
         self.cartasVagao.append(carta)
 
+    def adicionarCartas(self, cartas: List[CartaVagao]):
+        """Adiciona várias cartas à mão de uma vez"""
+        self.cartasVagao.extend(cartas)
+
     def removerCartas(self, cartas: List[CartaVagao]) -> bool:
         """Remove as cartas especificadas da mão
         
+        Faz uma única passada pela mão (O(n + k)): as cartas pedidas são
+        contadas por chave e a mão é reconstruída sem elas. Se alguma não
+        estiver na mão, nada é removido.
+        
         Returns:
             True se todas as cartas foram removidas com sucesso
         """
-        for c in cartas:
-            if c not in self.cartasVagao:
-                return False
-        for c in cartas:
-            self.cartasVagao.remove(c)
+        restantes, pendentes = separar_cartas(self.cartasVagao, cartas)
+        if any(pendentes.values()):
+            return False
+        
+        self.cartasVagao[:] = restantes
         return True
 
     def getQuantidade(self, cor=None) -> int:
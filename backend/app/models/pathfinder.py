@@ -91,6 +91,38 @@ class PathFinder:
         # BFS para encontrar caminho
         return self._bfs(origem.id, destino.id, grafo)
     
+    def verificar_caminhos_existem(
+        self,
+        pares: List[Tuple[Cidade, Cidade]],
+        rotas_conquistadas: List[Rota]
+    ) -> List[bool]:
+        """
+        Verifica vários pares origem/destino sobre o mesmo conjunto de rotas.
+        
+        O grafo é percorrido uma única vez para rotular seus componentes
+        conexos; cada par é então respondido comparando os rótulos das duas
+        cidades, em vez de uma BFS por par.
+        
+        Args:
+            pares: Lista de tuplas (origem, destino)
+            rotas_conquistadas: Lista de rotas já conquistadas
+            
+        Returns:
+            Lista de booleanos na mesma ordem dos pares
+        """
+        componentes = self._rotular_componentes(
+            self._construir_grafo(rotas_conquistadas) if rotas_conquistadas else {}
+        )
+        
+        resultados = []
+        for origem, destino in pares:
+            componente_origem = componentes.get(origem.id)
+            resultados.append(
+                origem.id == destino.id
+                or (componente_origem is not None and componente_origem == componentes.get(destino.id))
+            )
+        return resultados
+    
     def encontrar_caminho(
         self, 
         origem: Cidade, 
@@ -155,6 +187,38 @@ class PathFinder:
         
         return grafo
     
+    def _rotular_componentes(self, grafo: Dict[str, List[str]]) -> Dict[str, int]:
+        """
+        Rotula cada cidade do grafo com o índice do seu componente conexo.
+        
+        Uma BFS a partir de cada cidade ainda não rotulada cobre o grafo
+        inteiro em O(V + E); duas cidades estão conectadas se, e somente
+        se, têm o mesmo rótulo.
+        
+        Args:
+            grafo: Grafo de adjacência
+            
+        Returns:
+            Dicionário {cidade_id: indice_do_componente}
+        """
+        componentes: Dict[str, int] = {}
+        rotulo = 0
+        
+        for inicio in grafo:
+            if inicio in componentes:
+                continue
+            
+            componentes[inicio] = rotulo
+            fila = deque([inicio])
+            while fila:
+                for vizinho in grafo[fila.popleft()]:
+                    if vizinho not in componentes:
+                        componentes[vizinho] = rotulo
+                        fila.append(vizinho)
+            rotulo += 1
+        
+        return componentes
+    
     def _bfs(self, origem_id: str, destino_id: str, grafo: Dict[str, List[str]]) -> bool:
         """
         BFS (Breadth-First Search) para verificar conectividade.
@@ -333,6 +397,29 @@ class VerificadorBilhetes:
             rotas_conquistadas=rotas_conquistadas
         )
     
+    def verificar_bilhetes(
+        self, 
+        bilhetes: List, 
+        rotas_conquistadas: List[Rota]
+    ) -> List[bool]:
+        """
+        Verifica todos os bilhetes de uma vez.
+        
+        Monta o grafo das rotas conquistadas uma única vez para todos
+        os bilhetes (ver PathFinder.verificar_caminhos_existem).
+        
+        Args:
+            bilhetes: Lista de BilheteDestino do jogador
+            rotas_conquistadas: Rotas conquistadas pelo jogador
+            
+        Returns:
+            Lista de booleanos (True = completo) na ordem dos bilhetes
+        """
+        return self.pathfinder.verificar_caminhos_existem(
+            pares=[(b.cidadeOrigem, b.cidadeDestino) for b in bilhetes],
+            rotas_conquistadas=rotas_conquistadas
+        )
+    
     def listar_bilhetes_completos(
         self, 
         bilhetes: List, 
@@ -348,11 +435,8 @@ class VerificadorBilhetes:
         Returns:
             Lista de bilhetes completos
         """
-        completos = []
-        for bilhete in bilhetes:
-            if self.verificar_bilhete_completo(bilhete, rotas_conquistadas):
-                completos.append(bilhete)
-        return completos
+        status = self.verificar_bilhetes(bilhetes, rotas_conquistadas)
+        return [bilhete for bilhete, completo in zip(bilhetes, status) if completo]
     
     def listar_bilhetes_incompletos(
         self, 
@@ -369,11 +453,8 @@ class VerificadorBilhetes:
         Returns:
             Lista de bilhetes incompletos
         """
-        incompletos = []
-        for bilhete in bilhetes:
-            if not self.verificar_bilhete_completo(bilhete, rotas_conquistadas):
-                incompletos.append(bilhete)
-        return incompletos
+        status = self.verificar_bilhetes(bilhetes, rotas_conquistadas)
+        return [bilhete for bilhete, completo in zip(bilhetes, status) if not completo]
     
     def calcular_pontuacao_bilhetes(
         self, 
@@ -391,9 +472,10 @@ class VerificadorBilhetes:
             Pontuação total de bilhetes
         """
         pontuacao = 0
+        status = self.verificar_bilhetes(bilhetes, rotas_conquistadas)
         
-        for bilhete in bilhetes:
-            if self.verificar_bilhete_completo(bilhete, rotas_conquistadas):
+        for bilhete, completo in zip(bilhetes, status):
+            if completo:
                 pontuacao += bilhete.pontos
             else:
                 pontuacao -= bilhete.pontos
@@ -131,16 +131,16 @@ class PontuacaoFinalCalculator:
         Returns:
             ResultadoJogador com pontuação detalhada
         """
-        # Calcular bilhetes completos e incompletos
-        bilhetes_completos = self.verificador_bilhetes.listar_bilhetes_completos(
+        # Calcular bilhetes completos e incompletos (uma única verificação)
+        status_bilhetes = self.verificador_bilhetes.verificar_bilhetes(
             bilhetes=bilhetes,
             rotas_conquistadas=rotas_conquistadas
         )
         
-        bilhetes_incompletos = self.verificador_bilhetes.listar_bilhetes_incompletos(
-            bilhetes=bilhetes,
-            rotas_conquistadas=rotas_conquistadas
-        )
+        bilhetes_completos: List[BilheteDestino] = []
+        bilhetes_incompletos: List[BilheteDestino] = []
+        for bilhete, completo in zip(bilhetes, status_bilhetes):
+            (bilhetes_completos if completo else bilhetes_incompletos).append(bilhete)
         
         # Calcular pontos de bilhetes
         pontos_completos = sum(b.pontos for b in bilhetes_completos)
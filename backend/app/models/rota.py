@@ -3,7 +3,7 @@ from .cidade import Cidade
 from .cor import Cor
 from typing import Optional, List
 
-@dataclass
+@dataclass(slots=True)
 class Rota:
     id: str
     cidadeA: Cidade
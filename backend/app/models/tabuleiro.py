@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # Import local types lazily to avoid circulars during typing
 from .validador_rotas_duplas import ValidadorRotasDuplas
@@ -11,6 +11,19 @@ class Tabuleiro:
     cidades: List[Cidade] = field(default_factory=list)
     rotas: List[Rota] = field(default_factory=list)
     validador_duplas: Optional[ValidadorRotasDuplas] = None
+    # Índice id → Rota para buscas O(1); reconstruído por indexarRotas()
+    rotasPorId: Dict[str, Rota] = field(default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.indexarRotas()
+
+    def indexarRotas(self) -> None:
+        """Reconstrói o índice de rotas por ID
+
+        Deve ser chamado sempre que self.rotas for alterada depois da
+        construção: obterRotaPorId confia apenas no índice.
+        """
+        self.rotasPorId = {r.id: r for r in self.rotas}
 
     def obterRotasDisponiveis(self, rota) -> List[Rota]:
         """Retorna todas as rotas disponíveis (não reivindicadas)"""
@@ -18,10 +31,8 @@ class Tabuleiro:
 
     def obterDisponiveisRota(self, rota) -> bool:
         """Verifica se uma rota específica está disponível"""
-        for r in self.rotas:
-            if r.id == rota.id:
-                return r.proprietario is None
-        return False
+        r = self.obterRotaPorId(rota.id)
+        return r is not None and r.proprietario is None
 
     def obterCidadesNaCidade(self, cidade: Cidade) -> List[Cidade]:
         """Retorna todas as cidades conectadas a uma cidade específica"""
@@ -34,11 +45,8 @@ class Tabuleiro:
         return cidades_conectadas
 
     def obterRotaPorId(self, id_rota: str) -> Optional[Rota]:
-        """Busca uma rota pelo ID"""
-        for r in self.rotas:
-            if r.id == id_rota:
-                return r
-        return None
+        """Busca uma rota pelo ID no índice mantido por indexarRotas()"""
+        return self.rotasPorId.get(id_rota)
 
     def obterCidade(self, id_cidade: str) -> Optional[Cidade]:
         """Busca uma cidade pelo ID"""